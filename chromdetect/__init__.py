@@ -31,7 +31,7 @@ from chromdetect.core import (
     parse_fasta_from_handle,
     write_fasta,
 )
-from chromdetect.html_report import generate_html_report
+from chromdetect.html_report import generate_html_report, write_html_report
 from chromdetect.patterns import (
     CHROMOSOME_PATTERNS,
     FRAGMENT_PATTERNS,
@@ -73,4 +73,5 @@ __all__ = [
     "format_comparison_tsv",
     # HTML report
     "generate_html_report",
+    "write_html_report",
 ]
@@ -13,11 +13,16 @@ Example report header format:
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from pathlib import Path
 
+# One entry is created per report line; use slots where the running Python
+# supports it (dataclass(slots=True) is 3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class AssemblyReportEntry:
     """A single entry from an NCBI assembly report.
 
@@ -57,58 +62,59 @@ class AssemblyReport:
     taxid: str | None
     entries: list[AssemblyReportEntry]
 
+    def _index(self) -> tuple[dict[str, str], set[str], set[str], set[str]]:
+        """Build the chromosome map and per-role name sets in a single pass.
+
+        Returns:
+            Tuple of (chromosome_map, chromosome_scaffolds,
+            unlocalized_scaffolds, unplaced_scaffolds)
+        """
+        mapping: dict[str, str] = {}
+        role_names: dict[str, set[str]] = {
+            "assembled-molecule": set(),
+            "unlocalized-scaffold": set(),
+            "unplaced-scaffold": set(),
+        }
+        for entry in self.entries:
+            # Each entry is known by its sequence name and any real accessions
+            names = [entry.sequence_name]
+            if entry.genbank_accession and entry.genbank_accession.lower() != "na":
+                names.append(entry.genbank_accession)
+            if entry.refseq_accession and entry.refseq_accession.lower() != "na":
+                names.append(entry.refseq_accession)
+
+            if entry.assigned_molecule and entry.assigned_molecule.lower() != "na":
+                for name in names:
+                    mapping[name] = entry.assigned_molecule
+            if entry.sequence_role in role_names:
+                role_names[entry.sequence_role].update(names)
+
+        return (
+            mapping,
+            role_names["assembled-molecule"],
+            role_names["unlocalized-scaffold"],
+            role_names["unplaced-scaffold"],
+        )
+
     @property
     def chromosome_map(self) -> dict[str, str]:
         """Get mapping of scaffold names to chromosome IDs."""
-        mapping = {}
-        for entry in self.entries:
-            if entry.assigned_molecule and entry.assigned_molecule.lower() != "na":
-                # Map both sequence name and accessions
-                mapping[entry.sequence_name] = entry.assigned_molecule
-                if entry.genbank_accession and entry.genbank_accession.lower() != "na":
-                    mapping[entry.genbank_accession] = entry.assigned_molecule
-                if entry.refseq_accession and entry.refseq_accession.lower() != "na":
-                    mapping[entry.refseq_accession] = entry.assigned_molecule
-        return mapping
+        return self._index()[0]
 
     @property
     def chromosome_scaffolds(self) -> set[str]:
         """Get set of scaffold names that are chromosome-level."""
-        names = set()
-        for entry in self.entries:
-            if entry.sequence_role == "assembled-molecule":
-                names.add(entry.sequence_name)
-                if entry.genbank_accession and entry.genbank_accession.lower() != "na":
-                    names.add(entry.genbank_accession)
-                if entry.refseq_accession and entry.refseq_accession.lower() != "na":
-                    names.add(entry.refseq_accession)
-        return names
+        return self._index()[1]
 
     @property
     def unlocalized_scaffolds(self) -> set[str]:
         """Get set of scaffold names that are unlocalized."""
-        names = set()
-        for entry in self.entries:
-            if entry.sequence_role == "unlocalized-scaffold":
-                names.add(entry.sequence_name)
-                if entry.genbank_accession and entry.genbank_accession.lower() != "na":
-                    names.add(entry.genbank_accession)
-                if entry.refseq_accession and entry.refseq_accession.lower() != "na":
-                    names.add(entry.refseq_accession)
-        return names
+        return self._index()[2]
 
     @property
     def unplaced_scaffolds(self) -> set[str]:
         """Get set of scaffold names that are unplaced."""
-        names = set()
-        for entry in self.entries:
-            if entry.sequence_role == "unplaced-scaffold":
-                names.add(entry.sequence_name)
-                if entry.genbank_accession and entry.genbank_accession.lower() != "na":
-                    names.add(entry.genbank_accession)
-                if entry.refseq_accession and entry.refseq_accession.lower() != "na":
-                    names.add(entry.refseq_accession)
-        return names
+        return self._index()[3]
 
     def get_expected_chromosome_count(self) -> int:
         """Get the expected number of chromosomes."""
@@ -261,10 +267,8 @@ def apply_assembly_report(
         Tuple of (classifications, expected_chromosome_count)
         classifications is a list of (name, classification, chromosome_id) tuples
     """
-    chr_scaffolds = report.chromosome_scaffolds
-    unloc_scaffolds = report.unlocalized_scaffolds
-    unplaced_scaffolds = report.unplaced_scaffolds
-    chr_map = report.chromosome_map
+    # One pass over the report entries instead of one per property
+    chr_map, chr_scaffolds, unloc_scaffolds, unplaced_scaffolds = report._index()
 
     classifications = []
     for name, _length, _seq in scaffolds:
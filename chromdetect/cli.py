@@ -7,6 +7,8 @@ from __future__ import annotations
 import argparse
 import json
 import sys
+from heapq import nlargest
+from operator import attrgetter
 from pathlib import Path
 
 from chromdetect import __version__
@@ -26,7 +28,7 @@ from chromdetect.core import (
     parse_fasta_from_handle,
     write_fasta,
 )
-from chromdetect.html_report import generate_html_report
+from chromdetect.html_report import generate_html_report, write_html_report
 from chromdetect.patterns import (
     CHROMOSOME_PATTERNS,
     FRAGMENT_PATTERNS,
@@ -141,7 +143,7 @@ def format_output(
         lines.extend(["", "-" * 60, "Top 20 Scaffolds:", "-" * 60])
 
         # Show top scaffolds
-        top_results = sorted(results, key=lambda r: -r.length)[:20]
+        top_results = nlargest(20, results, key=attrgetter("length"))
         for r in top_results:
             chr_str = f" ({r.chromosome_id})" if r.chromosome_id else ""
             gc_str = f" GC:{r.gc_content*100:.1f}%" if r.gc_content is not None else ""
@@ -253,11 +255,13 @@ def process_batch(
                 results = [r for r in results if r.length >= args.min_length]
 
             # Format and write output
-            output = format_output(results, stats, args.format, fasta_path.stem)
             out_ext_actual = ".html" if args.format == "html" else out_ext
             out_file = output_dir / f"{fasta_path.stem}{out_ext_actual}"
             with open(out_file, "w") as f:
-                f.write(output)
+                if args.format == "html":
+                    write_html_report(results, stats, f, fasta_path.stem)
+                else:
+                    f.write(format_output(results, stats, args.format, fasta_path.stem))
 
             # Track summary
             results_summary.append({
@@ -301,8 +305,13 @@ def process_batch(
         print(f"Summary written to {summary_file}", file=sys.stderr)
 
 
-def main() -> None:
-    """Main entry point for chromdetect CLI."""
+def main(argv: list[str] | None = None) -> None:
+    """Main entry point for chromdetect CLI.
+
+    Args:
+        argv: Command-line arguments, excluding the program name. If None,
+            arguments are read from sys.argv.
+    """
     parser = argparse.ArgumentParser(
         prog="chromdetect",
         description="Detect chromosome-level scaffolds in genome assemblies",
@@ -439,7 +448,7 @@ Supported naming conventions:
         help="Show supported naming patterns and exit",
     )
 
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
 
     # Handle --list-patterns before requiring fasta argument
     if args.list_patterns:
@@ -707,18 +716,19 @@ Supported naming conventions:
 
         sys.exit(EXIT_SUCCESS)
 
-    # Format output
+    # Format and write output
     assembly_name = Path(args.fasta).stem if args.fasta != "-" else "Assembly"
-    output = format_output(results, stats, args.format, assembly_name)
-
-    # Write output
     if args.output:
         with open(args.output, "w") as f:
-            f.write(output)
+            if args.format == "html":
+                # Stream the report to disk instead of building it in memory
+                write_html_report(results, stats, f, assembly_name)
+            else:
+                f.write(format_output(results, stats, args.format, assembly_name))
         if not args.quiet:
             print(f"Results written to {args.output}", file=sys.stderr)
     else:
-        print(output)
+        print(format_output(results, stats, args.format, assembly_name))
 
 
 if __name__ == "__main__":
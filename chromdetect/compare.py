@@ -100,11 +100,11 @@ def compare_assemblies(
     chr1 = {r.name: r for r in results1 if r.classification == "chromosome"}
     chr2 = {r.name: r for r in results2 if r.classification == "chromosome"}
 
-    # Find shared and unique chromosomes
-    shared_names = set(chr1.keys()) & set(chr2.keys())
-    unique_to_1 = sorted(set(chr1.keys()) - set(chr2.keys()))
-    unique_to_2 = sorted(set(chr2.keys()) - set(chr1.keys()))
-    shared_chromosomes = sorted(shared_names)
+    # Find shared and unique chromosomes; dict key views support set
+    # operations directly, so no intermediate sets are copied
+    shared_chromosomes = sorted(chr1.keys() & chr2.keys())
+    unique_to_1 = sorted(chr1.keys() - chr2.keys())
+    unique_to_2 = sorted(chr2.keys() - chr1.keys())
 
     # Calculate size differences for shared chromosomes
     size_differences = {}
@@ -120,12 +120,11 @@ def compare_assemblies(
 
     classification_changes = []
     # Check scaffolds present in both
-    common_scaffolds = set(all_names_1.keys()) & set(all_names_2.keys())
-    for name in sorted(common_scaffolds):
-        r1 = all_names_1[name]
-        r2 = all_names_2[name]
-        if r1.classification != r2.classification:
-            classification_changes.append((name, r1.classification, r2.classification))
+    for name in sorted(all_names_1.keys() & all_names_2.keys()):
+        class1 = all_names_1[name].classification
+        class2 = all_names_2[name].classification
+        if class1 != class2:
+            classification_changes.append((name, class1, class2))
 
     return ComparisonResult(
         assembly1_name=assembly1_name,
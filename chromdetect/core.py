@@ -8,18 +8,24 @@ chromosome-level scaffolds in genome assemblies.
 from __future__ import annotations
 
 import gzip
+import sys
 import typing
-from dataclasses import asdict, dataclass
+from dataclasses import dataclass, fields
 from pathlib import Path
 
 from chromdetect.patterns import (
-    COMPILED_CHROMOSOME_PATTERNS,
-    COMPILED_FRAGMENT,
-    COMPILED_UNLOCALIZED,
+    COMPILED_FRAGMENT_RE,
+    COMPILED_UNLOCALIZED_RE,
+    combine_search_patterns,
+    match_chromosome,
 )
 
+# Records are created once per scaffold; use slots where the running
+# Python supports it (dataclass(slots=True) is 3.10+)
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class ScaffoldInfo:
     """Information about a single scaffold.
 
@@ -43,10 +49,15 @@ class ScaffoldInfo:
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        # Every field is a scalar, so a flat copy matches asdict() without
+        # its recursive deep-copy machinery
+        return {name: getattr(self, name) for name in _SCAFFOLD_FIELDS}
+
 
+_SCAFFOLD_FIELDS = tuple(f.name for f in fields(ScaffoldInfo))
 
-@dataclass
+
+@dataclass(**_DATACLASS_SLOTS)
 class AssemblyStats:
     """Summary statistics for the assembly.
 
@@ -78,7 +89,10 @@ class AssemblyStats:
 
     def to_dict(self) -> dict:
         """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        return {name: getattr(self, name) for name in _STATS_FIELDS}
+
+
+_STATS_FIELDS = tuple(f.name for f in fields(AssemblyStats))
 
 
 def parse_fasta_from_handle(
@@ -105,6 +119,7 @@ def parse_fasta_from_handle(
     current_name: str | None = None
     current_length = 0
     current_seq_parts: list[str] = []
+    current_sample_length = 0
     sample_limit = 10000  # Only keep first 10kb for GC calculation (if not keeping full)
     line_count = 0
     found_header = False
@@ -133,6 +148,7 @@ def parse_fasta_from_handle(
             current_name = header_parts[0]
             current_length = 0
             current_seq_parts = []
+            current_sample_length = 0
         else:
             # This is sequence data
             if not found_header:
@@ -140,18 +156,16 @@ def parse_fasta_from_handle(
                     f"Line {line_count}: Sequence data before first FASTA header. "
                     "File may not be in FASTA format."
                 )
-            # Validate sequence characters (allow standard nucleotides + ambiguity codes)
-            valid_chars = set("ACGTNUacgtnuRYSWKMBDHVryswkmbdhv.-")
-            invalid_chars = set(line) - valid_chars
-            if invalid_chars:
-                # Only warn for non-whitespace invalid chars, don't fail
-                # Some FASTA files have quality scores or other data
-                pass
+            # Sequence characters are not validated: some FASTA files carry
+            # quality scores or other data, and those are tolerated silently
             current_length += len(line)
             if keep_full_sequence:
                 current_seq_parts.append(line)
-            elif sum(len(s) for s in current_seq_parts) < sample_limit:
+            elif current_sample_length < sample_limit:
+                # Track the sample size as we go; once it is reached the rest
+                # of the record only contributes to its length
                 current_seq_parts.append(line)
+                current_sample_length += len(line)
 
     # Don't forget last scaffold
     if current_name is not None:
@@ -217,11 +231,45 @@ def calculate_gc(sequence: str) -> float | None:
     if not sequence:
         return None
 
+    gc, total = _gc_counts(sequence)
+
+    return gc / total if total > 0 else None
+
+
+def _gc_counts(sequence: str) -> tuple[int, int]:
+    """Count G/C bases and total A/C/G/T bases in a sequence.
+
+    Args:
+        sequence: DNA sequence string
+
+    Returns:
+        Tuple of (gc_count, acgt_count)
+    """
     sequence = sequence.upper()
     gc = sequence.count("G") + sequence.count("C")
-    total = gc + sequence.count("A") + sequence.count("T")
+    return gc, gc + sequence.count("A") + sequence.count("T")
 
-    return gc / total if total > 0 else None
+
+def _nx(sorted_lengths: list[int], total: int, fraction: float) -> int:
+    """Return the Nx value for lengths already sorted in descending order.
+
+    Args:
+        sorted_lengths: Non-empty list of scaffold lengths, longest first
+        total: Sum of sorted_lengths
+        fraction: Fraction of the total length to reach (0.5 for N50)
+
+    Returns:
+        Length of the scaffold at which the running sum reaches the fraction
+    """
+    threshold = total * fraction
+    running_sum = 0
+
+    for length in sorted_lengths:
+        running_sum += length
+        if running_sum >= threshold:
+            return length
+
+    return sorted_lengths[-1]
 
 
 def calculate_n50(lengths: list[int]) -> int:
@@ -239,16 +287,7 @@ def calculate_n50(lengths: list[int]) -> int:
     if not lengths:
         return 0
 
-    sorted_lengths = sorted(lengths, reverse=True)
-    total = sum(sorted_lengths)
-    running_sum = 0
-
-    for length in sorted_lengths:
-        running_sum += length
-        if running_sum >= total / 2:
-            return length
-
-    return sorted_lengths[-1]
+    return _nx(sorted(lengths, reverse=True), sum(lengths), 0.5)
 
 
 def calculate_n90(lengths: list[int]) -> int:
@@ -263,16 +302,7 @@ def calculate_n90(lengths: list[int]) -> int:
     if not lengths:
         return 0
 
-    sorted_lengths = sorted(lengths, reverse=True)
-    total = sum(sorted_lengths)
-    running_sum = 0
-
-    for length in sorted_lengths:
-        running_sum += length
-        if running_sum >= total * 0.9:
-            return length
-
-    return sorted_lengths[-1]
+    return _nx(sorted(lengths, reverse=True), sum(lengths), 0.9)
 
 
 def detect_by_name(
@@ -297,13 +327,19 @@ def detect_by_name(
         - method: Description of detection method used
         - chromosome_id: Extracted chromosome ID if available (e.g., "1", "X")
     """
-    # Use custom patterns if provided, otherwise use built-in
-    if custom_patterns:
-        chr_patterns, unloc_patterns, frag_patterns = custom_patterns
-    else:
-        chr_patterns = COMPILED_CHROMOSOME_PATTERNS
-        unloc_patterns = COMPILED_UNLOCALIZED
-        frag_patterns = COMPILED_FRAGMENT
+    if not custom_patterns:
+        # Built-in patterns: one regex call per check via combined alternations
+        if COMPILED_UNLOCALIZED_RE.search(name):
+            return ("unlocalized", 0.8, "name_unlocalized", None)
+        if COMPILED_FRAGMENT_RE.search(name):
+            return ("unplaced", 0.6, "name_fragment", None)
+        chr_match = match_chromosome(name)
+        if chr_match:
+            method, chr_id = chr_match
+            return ("chromosome", 0.9, f"name_{method}", chr_id)
+        return ("other", 0.3, "name_none", None)
+
+    chr_patterns, unloc_patterns, frag_patterns = custom_patterns
 
     # Check for unlocalized patterns first (these override chromosome patterns)
     for pattern in unloc_patterns:
@@ -402,14 +438,22 @@ def classify_scaffolds(
     if not scaffolds:
         raise ValueError("No scaffolds found in assembly")
 
-    lengths = [s[1] for s in scaffolds]
-    n50 = calculate_n50(lengths)
-    n90 = calculate_n90(lengths)
-    largest = max(lengths)
-    total_length = sum(lengths)
+    # Sort once and share it between N50, N90 and the largest scaffold
+    sorted_lengths = sorted((s[1] for s in scaffolds), reverse=True)
+    total_length = sum(sorted_lengths)
+    n50 = _nx(sorted_lengths, total_length, 0.5)
+    n90 = _nx(sorted_lengths, total_length, 0.9)
+    largest = sorted_lengths[0]
 
-    # Build scaffold sequence lookup for GC calculation
-    scaffold_seqs = {name: seq for name, _length, seq in scaffolds}
+    # Custom unlocalized/fragment checks only ask whether any pattern
+    # matches, so fuse each list into one alternation for the whole run
+    if custom_patterns:
+        chr_patterns, unloc_patterns, frag_patterns = custom_patterns
+        custom_patterns = (
+            chr_patterns,
+            combine_search_patterns(unloc_patterns),
+            combine_search_patterns(frag_patterns),
+        )
 
     # Pre-compute assembly report classifications if provided
     report_classifications: dict[str, tuple[str, str | None]] = {}
@@ -420,16 +464,18 @@ def classify_scaffolds(
         report_class_list, report_expected = apply_assembly_report(
             scaffolds, assembly_report
         )
-        for name, classification, chr_id in report_class_list:
-            if classification != "unknown":
-                report_classifications[name] = (classification, chr_id)
+        report_classifications = {
+            name: (classification, chr_id)
+            for name, classification, chr_id in report_class_list
+            if classification != "unknown"
+        }
         # Use report's expected count if not already specified
         if expected_chromosomes is None and report_expected > 0:
             expected_chromosomes = report_expected
 
     results = []
 
-    for name, length, _seq_sample in scaffolds:
+    for name, length, seq_sample in scaffolds:
         # Check if we have an authoritative classification from assembly report
         if name in report_classifications:
             report_class, report_chr_id = report_classifications[name]
@@ -440,13 +486,9 @@ def classify_scaffolds(
             chr_id = report_chr_id
 
             # Calculate GC content for this scaffold
-            scaffold_gc = None
-            if name in scaffold_seqs:
-                seq = scaffold_seqs[name]
-                if seq:
-                    scaffold_gc = calculate_gc(seq)
-                    if scaffold_gc is not None:
-                        scaffold_gc = round(scaffold_gc, 4)
+            scaffold_gc = calculate_gc(seq_sample)
+            if scaffold_gc is not None:
+                scaffold_gc = round(scaffold_gc, 4)
 
             results.append(
                 ScaffoldInfo(
@@ -503,13 +545,9 @@ def classify_scaffolds(
             final_method = name_method
 
         # Calculate GC content for this scaffold
-        scaffold_gc = None
-        if name in scaffold_seqs:
-            seq = scaffold_seqs[name]
-            if seq:
-                scaffold_gc = calculate_gc(seq)
-                if scaffold_gc is not None:
-                    scaffold_gc = round(scaffold_gc, 4)
+        scaffold_gc = calculate_gc(seq_sample)
+        if scaffold_gc is not None:
+            scaffold_gc = round(scaffold_gc, 4)
 
         results.append(
             ScaffoldInfo(
@@ -527,25 +565,37 @@ def classify_scaffolds(
     if expected_chromosomes is not None:
         results = _adjust_for_karyotype(results, expected_chromosomes)
 
-    # Calculate statistics
-    chromosomes = [r for r in results if r.classification == "chromosome"]
-    unlocalized = [r for r in results if r.classification == "unlocalized"]
-    chr_lengths = [r.length for r in chromosomes]
-
-    # Calculate overall GC from samples
-    all_seqs = "".join(s[2] for s in scaffolds[:100])
-    gc_content = calculate_gc(all_seqs)
+    # Calculate statistics in a single pass over the results
+    chr_lengths: list[int] = []
+    unlocalized_count = unplaced_count = 0
+    for r in results:
+        if r.classification == "chromosome":
+            chr_lengths.append(r.length)
+        elif r.classification == "unlocalized":
+            unlocalized_count += 1
+        elif r.classification == "unplaced":
+            unplaced_count += 1
+
+    # Calculate overall GC from samples, summing per-sample counts rather
+    # than joining the samples into one large string first
+    gc_bases = acgt_bases = 0
+    for _name, _length, seq in scaffolds[:100]:
+        if seq:
+            gc, total = _gc_counts(seq)
+            gc_bases += gc
+            acgt_bases += total
+    gc_content = gc_bases / acgt_bases if acgt_bases > 0 else None
 
     stats = AssemblyStats(
         total_scaffolds=len(results),
         total_length=total_length,
         n50=n50,
         n90=n90,
-        chromosome_count=len(chromosomes),
+        chromosome_count=len(chr_lengths),
         chromosome_length=sum(chr_lengths),
         chromosome_n50=calculate_n50(chr_lengths) if chr_lengths else 0,
-        unlocalized_count=len(unlocalized),
-        unplaced_count=len([r for r in results if r.classification == "unplaced"]),
+        unlocalized_count=unlocalized_count,
+        unplaced_count=unplaced_count,
         largest_scaffold=largest,
         gc_content=round(gc_content, 4) if gc_content else None,
     )
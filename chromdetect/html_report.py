@@ -7,8 +7,15 @@ for visualizing assembly classification results.
 
 from __future__ import annotations
 
-import html
+import math
+import re
 from datetime import datetime
+from functools import lru_cache
+from heapq import nlargest
+from io import StringIO
+from operator import attrgetter, itemgetter
+from string import Template
+from typing import TextIO
 
 from chromdetect.core import AssemblyStats, ScaffoldInfo
 
@@ -16,7 +23,325 @@ from chromdetect.core import AssemblyStats, ScaffoldInfo
 # This is set at the end of the file after the main import
 __version__ = "0.5.0"
 
+# Static stylesheet shared by every report (plain string, no brace escaping)
+_STYLE_BLOCK = """    <style>
+        * {
+            box-sizing: border-box;
+            margin: 0;
+            padding: 0;
+        }
+        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
+            line-height: 1.6;
+            color: #333;
+            background: #f5f5f5;
+            padding: 20px;
+        }
+        .container {
+            max-width: 1200px;
+            margin: 0 auto;
+        }
+        header {
+            background: linear-gradient(135deg, #1a237e 0%, #283593 100%);
+            color: white;
+            padding: 30px;
+            border-radius: 8px 8px 0 0;
+            margin-bottom: 0;
+        }
+        header h1 {
+            font-size: 28px;
+            margin-bottom: 5px;
+        }
+        header .subtitle {
+            opacity: 0.9;
+            font-size: 16px;
+        }
+        .content {
+            background: white;
+            padding: 30px;
+            border-radius: 0 0 8px 8px;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+        }
+        .stats-grid {
+            display: grid;
+            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
+            gap: 20px;
+            margin-bottom: 30px;
+        }
+        .stat-card {
+            background: #f8f9fa;
+            border-radius: 8px;
+            padding: 20px;
+            text-align: center;
+        }
+        .stat-card .value {
+            font-size: 28px;
+            font-weight: bold;
+            color: #1a237e;
+        }
+        .stat-card .label {
+            font-size: 12px;
+            color: #666;
+            text-transform: uppercase;
+            letter-spacing: 0.5px;
+        }
+        .quality-badge {
+            display: inline-block;
+            padding: 8px 16px;
+            border-radius: 20px;
+            font-weight: bold;
+            font-size: 14px;
+        }
+        .charts {
+            display: grid;
+            grid-template-columns: 1fr 2fr;
+            gap: 30px;
+            margin-bottom: 30px;
+        }
+        .chart-container {
+            background: #f8f9fa;
+            border-radius: 8px;
+            padding: 20px;
+            display: flex;
+            justify-content: center;
+            align-items: center;
+        }
+        section {
+            margin-bottom: 30px;
+        }
+        section h2 {
+            font-size: 20px;
+            color: #1a237e;
+            margin-bottom: 15px;
+            padding-bottom: 10px;
+            border-bottom: 2px solid #e0e0e0;
+        }
+        table {
+            width: 100%;
+            border-collapse: collapse;
+            font-size: 13px;
+        }
+        th, td {
+            padding: 10px 12px;
+            text-align: left;
+            border-bottom: 1px solid #e0e0e0;
+        }
+        th {
+            background: #f5f5f5;
+            font-weight: 600;
+            color: #333;
+        }
+        tr:hover {
+            background: #f8f9fa;
+        }
+        .num {
+            text-align: right;
+            font-family: 'Monaco', 'Consolas', monospace;
+        }
+        .class-chr {
+            color: #4CAF50;
+            font-weight: 600;
+        }
+        .class-unloc {
+            color: #FF9800;
+        }
+        .class-unplaced {
+            color: #9E9E9E;
+        }
+        .class-other {
+            color: #607D8B;
+        }
+        .badge {
+            display: inline-block;
+            padding: 2px 8px;
+            border-radius: 10px;
+            font-size: 10px;
+            font-weight: 600;
+            text-transform: uppercase;
+        }
+        footer {
+            text-align: center;
+            padding: 20px;
+            color: #666;
+            font-size: 12px;
+        }
+        footer a {
+            color: #1a237e;
+        }
+        @media (max-width: 768px) {
+            .charts {
+                grid-template-columns: 1fr;
+            }
+            .stats-grid {
+                grid-template-columns: repeat(2, 1fr);
+            }
+        }
+    </style>"""
 
+# Page skeleton; only the $-placeholders vary between reports
+_PAGE_HTML = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>ChromDetect Report: ${assembly_name}</title>
+${style}
+</head>
+<body>
+    <div class="container">
+        <header>
+            <h1>ChromDetect Assembly Report</h1>
+            <div class="subtitle">${assembly_name} | Generated: ${timestamp}</div>
+        </header>
+
+        <div class="content">
+            <section>
+                <h2>Assembly Summary</h2>
+                <div class="stats-grid">
+                    <div class="stat-card">
+                        <div class="value">${total_scaffolds}</div>
+                        <div class="label">Total Scaffolds</div>
+                    </div>
+                    <div class="stat-card">
+                        <div class="value">${total_length}</div>
+                        <div class="label">Total Length</div>
+                    </div>
+                    <div class="stat-card">
+                        <div class="value">${n50}</div>
+                        <div class="label">N50</div>
+                    </div>
+                    <div class="stat-card">
+                        <div class="value">${chromosome_count}</div>
+                        <div class="label">Chromosomes</div>
+                    </div>
+                    <div class="stat-card">
+                        <div class="value">${gc_content}</div>
+                        <div class="label">GC Content</div>
+                    </div>
+                </div>
+            </section>
+
+            <section>
+                <h2>Visualizations</h2>
+                <div class="charts">
+                    <div class="chart-container">
+                        ${class_pie}
+                    </div>
+                    <div class="chart-container">
+                        ${size_bar}
+                    </div>
+                </div>
+            </section>
+
+            <section>
+                <h2>Scaffold Details (Top 100)</h2>
+                <table>
+                    <thead>
+                        <tr>
+                            <th>Name</th>
+                            <th class="num">Length (bp)</th>
+                            <th>Classification</th>
+                            <th class="num">Confidence</th>
+                            <th>Chr ID</th>
+                            <th>GC Content</th>
+                        </tr>
+                    </thead>
+                    <tbody>
+                        ${scaffold_table}
+                    </tbody>
+                </table>
+            </section>
+
+            <section>
+                <h2>Classification Statistics</h2>
+                <div class="stats-grid">
+                    <div class="stat-card">
+                        <div class="value">${chromosome_length}</div>
+                        <div class="label">Chromosome Length</div>
+                    </div>
+                    <div class="stat-card">
+                        <div class="value">${chromosome_n50}</div>
+                        <div class="label">Chromosome N50</div>
+                    </div>
+                    <div class="stat-card">
+                        <div class="value">${unlocalized_count}</div>
+                        <div class="label">Unlocalized</div>
+                    </div>
+                    <div class="stat-card">
+                        <div class="value">${unplaced_count}</div>
+                        <div class="label">Unplaced</div>
+                    </div>
+                    <div class="stat-card">
+                        <div class="value">${largest_scaffold}</div>
+                        <div class="label">Largest Scaffold</div>
+                    </div>
+                    <div class="stat-card">
+                        <div class="value">${n90}</div>
+                        <div class="label">N90</div>
+                    </div>
+                </div>
+            </section>
+        </div>
+
+        <footer>
+            Generated by <a href="https://github.com/shandley/chromdetect">ChromDetect</a> v${version}
+        </footer>
+    </div>
+</body>
+</html>
+"""
+
+# The skeleton split around the large sections, which are written as-is
+# instead of being substituted into one document-sized string.
+_PAGE_SPLIT = re.split(r"\$\{(style|class_pie|size_bar|scaffold_table)\}", _PAGE_HTML)
+_PAGE_TEXT = [Template(text) for text in _PAGE_SPLIT[::2]]
+_PAGE_SECTIONS = _PAGE_SPLIT[1::2]
+
+# Characters html.escape() would replace, and the same replacements as a
+# str.translate table
+_NEEDS_ESCAPE = re.compile(r"[&<>\"']")
+_HTML_ESCAPE_TABLE = str.maketrans(
+    {"&": "&amp;", "<": "&lt;", ">": "&gt;", '"': "&quot;", "'": "&#x27;"}
+)
+
+# Value field of the (label, value, color) chart data tuples
+_VALUE = itemgetter(1)
+
+# CSS class suffix for each classification in the scaffold table
+_CLASS_STYLE: dict[str, str] = {
+    "chromosome": "chr",
+    "unlocalized": "unloc",
+    "unplaced": "unplaced",
+}
+
+# One scaffold table row: name, length, class style, classification,
+# confidence, chromosome ID, GC content
+_ROW_FMT = (
+    '<tr><td>{}</td><td class="num">{:,}</td>'
+    '<td><span class="class-{}">{}</span></td>'
+    '<td class="num">{:.2f}</td><td>{}</td><td>{}</td></tr>'
+)
+
+# One bar chart bar (x, y, width, height, fill) and its rotated label
+# (x, y, text); the label's rotation centre is its own position
+_BAR_FMT = '<rect x="{}" y="{:.2f}" width="{}" height="{:.2f}" fill="{}" />'
+_BAR_LABEL_FMT = (
+    '<text x="{0}" y="{1}" font-size="8" transform="rotate(45 {0},{1})">{2}</text>'
+)
+
+
+def _escape(text: str) -> str:
+    """HTML-escape text, returning it unchanged when nothing needs escaping.
+
+    Equivalent to html.escape(text), but most scaffold names are plain
+    alphanumerics, so a single regex search usually suffices.
+    """
+    if _NEEDS_ESCAPE.search(text) is None:
+        return text
+    return text.translate(_HTML_ESCAPE_TABLE)
+
+
+@lru_cache(maxsize=256)
 def _format_bp(bp: int) -> str:
     """Format base pairs in human-readable format."""
     if bp >= 1_000_000_000:
@@ -46,7 +371,7 @@ def _generate_pie_chart(
     Returns:
         SVG markup string
     """
-    total = sum(v for _, v, _ in data)
+    total = sum(map(_VALUE, data))
     if total == 0:
         return f'<div class="chart-placeholder">{title}: No data</div>'
 
@@ -56,19 +381,19 @@ def _generate_pie_chart(
     svg_parts = [
         f'<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}">',
         f'<text x="{width // 2}" y="15" text-anchor="middle" '
-        f'font-size="14" font-weight="bold">{html.escape(title)}</text>',
+        f'font-size="14" font-weight="bold">{_escape(title)}</text>',
     ]
 
+    # Degrees per unit value, computed once for all slices
+    scale = 360.0 / total
     start_angle: float = 0.0
     for _label, value, color in data:
         if value == 0:
             continue
         percentage = value / total
-        end_angle = start_angle + percentage * 360
+        end_angle = start_angle + value * scale
 
         # Calculate arc points
-        import math
-
         start_rad = math.radians(start_angle - 90)
         end_rad = math.radians(end_angle - 90)
 
@@ -86,8 +411,8 @@ def _generate_pie_chart(
             )
         else:
             path = (
-                f"M {cx},{cy} L {x1},{y1} "
-                f"A {radius},{radius} 0 {large_arc},1 {x2},{y2} Z"
+                f"M {cx},{cy} L {x1:.2f},{y1:.2f} "
+                f"A {radius},{radius} 0 {large_arc},1 {x2:.2f},{y2:.2f} Z"
             )
             svg_parts.append(f'<path d="{path}" fill="{color}" />')
 
@@ -105,7 +430,7 @@ def _generate_pie_chart(
         )
         svg_parts.append(
             f'<text x="{legend_x + 14}" y="{legend_y}" font-size="10">'
-            f"{html.escape(label)} ({value:,}, {percentage:.1f}%)</text>"
+            f"{_escape(label)} ({value:,}, {percentage:.1f}%)</text>"
         )
         legend_x += 100
 
@@ -137,7 +462,7 @@ def _generate_bar_chart(
         return f'<div class="chart-placeholder">{title}: No data</div>'
 
     data = data[:max_bars]
-    max_value = max(v for _, v, _ in data) if data else 1
+    max_value = max(map(_VALUE, data)) if data else 1
 
     chart_left = 80
     chart_top = 35
@@ -148,7 +473,7 @@ def _generate_bar_chart(
     svg_parts = [
         f'<svg width="{width}" height="{height}" viewBox="0 0 {width} {height}">',
         f'<text x="{width // 2}" y="20" text-anchor="middle" '
-        f'font-size="14" font-weight="bold">{html.escape(title)}</text>',
+        f'font-size="14" font-weight="bold">{_escape(title)}</text>',
     ]
 
     # Y-axis labels
@@ -156,32 +481,24 @@ def _generate_bar_chart(
         y = chart_top + chart_height * (4 - i) / 4
         value = max_value * i / 4
         svg_parts.append(
-            f'<text x="{chart_left - 5}" y="{y + 4}" text-anchor="end" font-size="9">'
+            f'<text x="{chart_left - 5}" y="{y + 4:.2f}" text-anchor="end" font-size="9">'
             f"{_format_bp(int(value))}</text>"
         )
         svg_parts.append(
-            f'<line x1="{chart_left}" y1="{y}" x2="{width - 20}" y2="{y}" '
+            f'<line x1="{chart_left}" y1="{y:.2f}" x2="{width - 20}" y2="{y:.2f}" '
             f'stroke="#eee" stroke-width="1" />'
         )
 
-    # Bars
+    # Bars, each followed by its rotated label
     x = chart_left + 2
+    label_y = chart_top + chart_height + 5
     for label, value, color in data:
         bar_height = (value / max_value) * chart_height if max_value > 0 else 0
         bar_y = chart_top + chart_height - bar_height
+        label_x = x + bar_width // 2
 
-        svg_parts.append(
-            f'<rect x="{x}" y="{bar_y}" width="{bar_width}" height="{bar_height}" '
-            f'fill="{color}" />'
-        )
-
-        # Rotated label
-        label_y = chart_top + chart_height + 5
-        svg_parts.append(
-            f'<text x="{x + bar_width // 2}" y="{label_y}" font-size="8" '
-            f'transform="rotate(45 {x + bar_width // 2},{label_y})">'
-            f"{html.escape(label[:15])}</text>"
-        )
+        svg_parts.append(_BAR_FMT.format(x, bar_y, bar_width, bar_height, color))
+        svg_parts.append(_BAR_LABEL_FMT.format(label_x, label_y, _escape(label[:15])))
 
         x += bar_width + 2
 
@@ -189,27 +506,30 @@ def _generate_bar_chart(
     return "\n".join(svg_parts)
 
 
-def generate_html_report(
+def _render_scaffold_sections(
     results: list[ScaffoldInfo],
-    stats: AssemblyStats,
-    assembly_name: str = "Assembly",
-) -> str:
+) -> tuple[str, str, str]:
     """
-    Generate a complete HTML report for an assembly analysis.
+    Render the charts and scaffold table for a set of scaffolds.
 
     Args:
         results: List of ScaffoldInfo from classification
-        stats: AssemblyStats summary
-        assembly_name: Name to display for the assembly
 
     Returns:
-        Complete HTML document string
+        Tuple of (pie chart SVG, bar chart SVG, table rows HTML)
     """
-    # Count classifications
-    chr_count = sum(1 for r in results if r.classification == "chromosome")
-    unloc_count = sum(1 for r in results if r.classification == "unlocalized")
-    unplaced_count = sum(1 for r in results if r.classification == "unplaced")
-    other_count = len(results) - chr_count - unloc_count - unplaced_count
+    # Count classifications in a single pass
+    chr_count = unloc_count = unplaced_count = other_count = 0
+    for r in results:
+        classification = r.classification
+        if classification == "chromosome":
+            chr_count += 1
+        elif classification == "unlocalized":
+            unloc_count += 1
+        elif classification == "unplaced":
+            unplaced_count += 1
+        else:
+            other_count += 1
 
     # Generate pie chart data
     classification_data = [
@@ -219,8 +539,10 @@ def generate_html_report(
         ("Other", other_count, "#607D8B"),
     ]
 
-    # Top scaffolds by size for bar chart
-    top_scaffolds = sorted(results, key=lambda r: -r.length)[:20]
+    # Largest scaffolds for the table (top 100) and bar chart (top 20).
+    # nlargest is stable, so equal lengths keep their input order.
+    top_100 = nlargest(100, results, key=attrgetter("length"))
+    top_scaffolds = top_100[:20]
     scaffold_size_data = [
         (
             r.name[:20],
@@ -242,296 +564,96 @@ def generate_html_report(
 
     # Build scaffold table rows
     table_rows = []
-    for r in sorted(results, key=lambda x: -x.length)[:100]:
+    for r in top_100:
         gc_str = f"{r.gc_content * 100:.1f}%" if r.gc_content else "N/A"
-
-        class_style = {
-            "chromosome": "chr",
-            "unlocalized": "unloc",
-            "unplaced": "unplaced",
-        }.get(r.classification, "other")
-
         table_rows.append(
-            f"""
-            <tr>
-                <td>{html.escape(r.name)}</td>
-                <td class="num">{r.length:,}</td>
-                <td><span class="class-{class_style}">{r.classification}</span></td>
-                <td class="num">{r.confidence:.2f}</td>
-                <td>{r.chromosome_id or "-"}</td>
-                <td>{gc_str}</td>
-            </tr>
-            """
+            _ROW_FMT.format(
+                _escape(r.name),
+                r.length,
+                _CLASS_STYLE.get(r.classification, "other"),
+                r.classification,
+                r.confidence,
+                r.chromosome_id or "-",
+                gc_str,
+            )
         )
 
     scaffold_table = "\n".join(table_rows)
 
-    # Pre-format GC content for use in template
-    gc_content_str = f"{stats.gc_content * 100:.1f}%" if stats.gc_content else "N/A"
+    return class_pie, size_bar, scaffold_table
 
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-    html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>ChromDetect Report: {html.escape(assembly_name)}</title>
-    <style>
-        * {{
-            box-sizing: border-box;
-            margin: 0;
-            padding: 0;
-        }}
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Helvetica Neue', Arial, sans-serif;
-            line-height: 1.6;
-            color: #333;
-            background: #f5f5f5;
-            padding: 20px;
-        }}
-        .container {{
-            max-width: 1200px;
-            margin: 0 auto;
-        }}
-        header {{
-            background: linear-gradient(135deg, #1a237e 0%, #283593 100%);
-            color: white;
-            padding: 30px;
-            border-radius: 8px 8px 0 0;
-            margin-bottom: 0;
-        }}
-        header h1 {{
-            font-size: 28px;
-            margin-bottom: 5px;
-        }}
-        header .subtitle {{
-            opacity: 0.9;
-            font-size: 16px;
-        }}
-        .content {{
-            background: white;
-            padding: 30px;
-            border-radius: 0 0 8px 8px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        .stats-grid {{
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));
-            gap: 20px;
-            margin-bottom: 30px;
-        }}
-        .stat-card {{
-            background: #f8f9fa;
-            border-radius: 8px;
-            padding: 20px;
-            text-align: center;
-        }}
-        .stat-card .value {{
-            font-size: 28px;
-            font-weight: bold;
-            color: #1a237e;
-        }}
-        .stat-card .label {{
-            font-size: 12px;
-            color: #666;
-            text-transform: uppercase;
-            letter-spacing: 0.5px;
-        }}
-        .quality-badge {{
-            display: inline-block;
-            padding: 8px 16px;
-            border-radius: 20px;
-            font-weight: bold;
-            font-size: 14px;
-        }}
-        .charts {{
-            display: grid;
-            grid-template-columns: 1fr 2fr;
-            gap: 30px;
-            margin-bottom: 30px;
-        }}
-        .chart-container {{
-            background: #f8f9fa;
-            border-radius: 8px;
-            padding: 20px;
-            display: flex;
-            justify-content: center;
-            align-items: center;
-        }}
-        section {{
-            margin-bottom: 30px;
-        }}
-        section h2 {{
-            font-size: 20px;
-            color: #1a237e;
-            margin-bottom: 15px;
-            padding-bottom: 10px;
-            border-bottom: 2px solid #e0e0e0;
-        }}
-        table {{
-            width: 100%;
-            border-collapse: collapse;
-            font-size: 13px;
-        }}
-        th, td {{
-            padding: 10px 12px;
-            text-align: left;
-            border-bottom: 1px solid #e0e0e0;
-        }}
-        th {{
-            background: #f5f5f5;
-            font-weight: 600;
-            color: #333;
-        }}
-        tr:hover {{
-            background: #f8f9fa;
-        }}
-        .num {{
-            text-align: right;
-            font-family: 'Monaco', 'Consolas', monospace;
-        }}
-        .class-chr {{
-            color: #4CAF50;
-            font-weight: 600;
-        }}
-        .class-unloc {{
-            color: #FF9800;
-        }}
-        .class-unplaced {{
-            color: #9E9E9E;
-        }}
-        .class-other {{
-            color: #607D8B;
-        }}
-        .badge {{
-            display: inline-block;
-            padding: 2px 8px;
-            border-radius: 10px;
-            font-size: 10px;
-            font-weight: 600;
-            text-transform: uppercase;
-        }}
-        footer {{
-            text-align: center;
-            padding: 20px;
-            color: #666;
-            font-size: 12px;
-        }}
-        footer a {{
-            color: #1a237e;
-        }}
-        @media (max-width: 768px) {{
-            .charts {{
-                grid-template-columns: 1fr;
-            }}
-            .stats-grid {{
-                grid-template-columns: repeat(2, 1fr);
-            }}
-        }}
-    </style>
-</head>
-<body>
-    <div class="container">
-        <header>
-            <h1>ChromDetect Assembly Report</h1>
-            <div class="subtitle">{html.escape(assembly_name)} | Generated: {timestamp}</div>
-        </header>
+def write_html_report(
+    results: list[ScaffoldInfo],
+    stats: AssemblyStats,
+    out: TextIO,
+    assembly_name: str = "Assembly",
+) -> None:
+    """
+    Write a complete HTML report for an assembly analysis to a file object.
 
-        <div class="content">
-            <section>
-                <h2>Assembly Summary</h2>
-                <div class="stats-grid">
-                    <div class="stat-card">
-                        <div class="value">{stats.total_scaffolds:,}</div>
-                        <div class="label">Total Scaffolds</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="value">{_format_bp(stats.total_length)}</div>
-                        <div class="label">Total Length</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="value">{_format_bp(stats.n50)}</div>
-                        <div class="label">N50</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="value">{stats.chromosome_count}</div>
-                        <div class="label">Chromosomes</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="value">{gc_content_str}</div>
-                        <div class="label">GC Content</div>
-                    </div>
-                </div>
-            </section>
+    The page is written piece by piece, so the full document is never
+    held in memory as a single string.
 
-            <section>
-                <h2>Visualizations</h2>
-                <div class="charts">
-                    <div class="chart-container">
-                        {class_pie}
-                    </div>
-                    <div class="chart-container">
-                        {size_bar}
-                    </div>
-                </div>
-            </section>
+    Args:
+        results: List of ScaffoldInfo from classification
+        stats: AssemblyStats summary
+        out: Text file object to write the report to
+        assembly_name: Name to display for the assembly
+    """
+    class_pie, size_bar, scaffold_table = _render_scaffold_sections(results)
+    sections = {
+        "style": _STYLE_BLOCK,
+        "class_pie": class_pie,
+        "size_bar": size_bar,
+        "scaffold_table": scaffold_table,
+    }
 
-            <section>
-                <h2>Scaffold Details (Top 100)</h2>
-                <table>
-                    <thead>
-                        <tr>
-                            <th>Name</th>
-                            <th class="num">Length (bp)</th>
-                            <th>Classification</th>
-                            <th class="num">Confidence</th>
-                            <th>Chr ID</th>
-                            <th>GC Content</th>
-                        </tr>
-                    </thead>
-                    <tbody>
-                        {scaffold_table}
-                    </tbody>
-                </table>
-            </section>
+    # Pre-format GC content for use in template
+    gc_content_str = f"{stats.gc_content * 100:.1f}%" if stats.gc_content else "N/A"
 
-            <section>
-                <h2>Classification Statistics</h2>
-                <div class="stats-grid">
-                    <div class="stat-card">
-                        <div class="value">{_format_bp(stats.chromosome_length)}</div>
-                        <div class="label">Chromosome Length</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="value">{_format_bp(stats.chromosome_n50)}</div>
-                        <div class="label">Chromosome N50</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="value">{stats.unlocalized_count}</div>
-                        <div class="label">Unlocalized</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="value">{stats.unplaced_count}</div>
-                        <div class="label">Unplaced</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="value">{_format_bp(stats.largest_scaffold)}</div>
-                        <div class="label">Largest Scaffold</div>
-                    </div>
-                    <div class="stat-card">
-                        <div class="value">{_format_bp(stats.n90)}</div>
-                        <div class="label">N90</div>
-                    </div>
-                </div>
-            </section>
-        </div>
+    timestamp = datetime.now().isoformat(sep=" ", timespec="seconds")
+
+    fields = {
+        "assembly_name": _escape(assembly_name),
+        "timestamp": timestamp,
+        "total_scaffolds": f"{stats.total_scaffolds:,}",
+        "total_length": _format_bp(stats.total_length),
+        "n50": _format_bp(stats.n50),
+        "chromosome_count": stats.chromosome_count,
+        "gc_content": gc_content_str,
+        "chromosome_length": _format_bp(stats.chromosome_length),
+        "chromosome_n50": _format_bp(stats.chromosome_n50),
+        "unlocalized_count": stats.unlocalized_count,
+        "unplaced_count": stats.unplaced_count,
+        "largest_scaffold": _format_bp(stats.largest_scaffold),
+        "n90": _format_bp(stats.n90),
+        "version": __version__,
+    }
+
+    write = out.write
+    write(_PAGE_TEXT[0].substitute(fields))
+    for section, text in zip(_PAGE_SECTIONS, _PAGE_TEXT[1:]):
+        write(sections[section])
+        write(text.substitute(fields))
 
-        <footer>
-            Generated by <a href="https://github.com/shandley/chromdetect">ChromDetect</a> v{__version__}
-        </footer>
-    </div>
-</body>
-</html>
-"""
-    return html_content
+
+def generate_html_report(
+    results: list[ScaffoldInfo],
+    stats: AssemblyStats,
+    assembly_name: str = "Assembly",
+) -> str:
+    """
+    Generate a complete HTML report for an assembly analysis.
+
+    Args:
+        results: List of ScaffoldInfo from classification
+        stats: AssemblyStats summary
+        assembly_name: Name to display for the assembly
+
+    Returns:
+        Complete HTML document string
+    """
+    buffer = StringIO()
+    write_html_report(results, stats, buffer, assembly_name)
+    return buffer.getvalue()
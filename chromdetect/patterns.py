@@ -38,6 +38,7 @@ from __future__ import annotations
 
 import json
 import re
+from functools import lru_cache
 from pathlib import Path
 from re import Pattern
 
@@ -100,6 +101,12 @@ FRAGMENT_PATTERNS: list[str] = [
     r'debris',
 ]
 
+# Regex flags for the built-in scaffold name patterns. Scaffold names are
+# ASCII, so re.ASCII keeps \d, \w, \s and case-insensitive matching to ASCII
+# only. User-supplied patterns are compiled with re.IGNORECASE alone, so
+# their Unicode semantics (and any inline (?u) flag) keep working.
+PATTERN_FLAGS = re.IGNORECASE | re.ASCII
+
 # Sex chromosome identifiers
 SEX_CHROMOSOMES: set[str] = {'X', 'Y', 'Z', 'W', 'x', 'y', 'z', 'w'}
 
@@ -107,21 +114,187 @@ SEX_CHROMOSOMES: set[str] = {'X', 'Y', 'Z', 'W', 'x', 'y', 'z', 'w'}
 MITOCHONDRIAL_IDS: set[str] = {'M', 'MT', 'Mt', 'mt', 'mito', 'mitochondrion'}
 
 
+@lru_cache(maxsize=1024)
+def _compile_pattern(pattern: str) -> Pattern[str]:
+    """Compile a single custom name pattern, reusing earlier compilations."""
+    return re.compile(pattern, re.IGNORECASE)
+
+
 def compile_patterns() -> list[tuple[Pattern[str], str]]:
     """Compile chromosome patterns for efficient matching."""
-    return [(re.compile(p, re.IGNORECASE), name) for p, name in CHROMOSOME_PATTERNS]
+    return [(re.compile(p, PATTERN_FLAGS), name) for p, name in CHROMOSOME_PATTERNS]
 
 
 def compile_exclusion_patterns() -> tuple[list[Pattern[str]], list[Pattern[str]]]:
     """Compile exclusion patterns (unlocalized, fragments)."""
-    unloc = [re.compile(p, re.IGNORECASE) for p in UNLOCALIZED_PATTERNS]
-    frag = [re.compile(p, re.IGNORECASE) for p in FRAGMENT_PATTERNS]
+    unloc = [re.compile(p, PATTERN_FLAGS) for p in UNLOCALIZED_PATTERNS]
+    frag = [re.compile(p, PATTERN_FLAGS) for p in FRAGMENT_PATTERNS]
+    return unloc, frag
+
+
+def compile_combined_exclusion_patterns() -> tuple[Pattern[str], Pattern[str]]:
+    """Compile exclusion patterns into one alternation each (unlocalized, fragments).
+
+    Each pattern is wrapped in a non-capturing group, so a single ``search``
+    matches if and only if any of the individual patterns would.
+    """
+    unloc = re.compile("|".join(f"(?:{p})" for p in UNLOCALIZED_PATTERNS), PATTERN_FLAGS)
+    frag = re.compile("|".join(f"(?:{p})" for p in FRAGMENT_PATTERNS), PATTERN_FLAGS)
     return unloc, frag
 
 
+# A global inline flag group such as (?i) or (?ms); scoped (?i:...) is fine
+_GLOBAL_INLINE_FLAGS = re.compile(r"\(\?[aiLmsux]+\)")
+
+
+def combine_search_patterns(patterns: list[Pattern[str]]) -> list[Pattern[str]]:
+    """Fuse compiled search patterns into as few patterns as is safe.
+
+    A name matches the result if and only if it matches any input pattern,
+    so callers that ``search`` each pattern in turn can use it unchanged.
+    Patterns are fused per distinct set of flags (e.g. custom and built-in
+    patterns), and only when none has groups (and hence no backreferences
+    that joining could renumber) or global inline flags such as ``(?i)``,
+    which must start the whole expression; otherwise, or when no two
+    patterns share flags, the input list is returned as-is.
+
+    Args:
+        patterns: Compiled patterns, e.g. the unlocalized or fragment list
+                 from merge_patterns()
+
+    Returns:
+        List holding one combined pattern per flag set, or the original list
+    """
+    if len(patterns) < 2:
+        return patterns
+    if any(p.groups or _GLOBAL_INLINE_FLAGS.search(p.pattern) for p in patterns):
+        return patterns
+    by_flags: dict[int, list[str]] = {}
+    for p in patterns:
+        by_flags.setdefault(p.flags, []).append(f"(?:{p.pattern})")
+    if len(by_flags) == len(patterns):
+        return patterns
+    return [re.compile("|".join(parts), flags) for flags, parts in by_flags.items()]
+
+
+def compile_combined_pattern(
+    patterns: list[tuple[str, str]] | None = None,
+) -> tuple[Pattern[str], dict[str, int | None]]:
+    """Compile chromosome patterns into a single alternation.
+
+    Each pattern is wrapped in a named group so the matching method can be
+    recovered from ``match.lastgroup``. Alternatives are tried in the same
+    order as CHROMOSOME_PATTERNS, so the first matching pattern still wins.
+
+    Args:
+        patterns: (pattern, method_name) pairs; defaults to CHROMOSOME_PATTERNS
+
+    Returns:
+        Tuple of (combined pattern, mapping of method name to the group
+        index holding the chromosome ID, or None if the pattern has no ID)
+    """
+    if patterns is None:
+        patterns = CHROMOSOME_PATTERNS
+    parts = []
+    id_groups: dict[str, int | None] = {}
+    group_index = 0
+    for pattern, name in patterns:
+        inner_groups = re.compile(pattern).groups
+        parts.append(f"(?P<{name}>{pattern})")
+        id_groups[name] = group_index + 2 if inner_groups else None
+        group_index += 1 + inner_groups
+    return re.compile("|".join(parts), PATTERN_FLAGS), id_groups
+
+
+def _required_first_char(pattern: str) -> str | None:
+    """Return the literal first character every match must start with.
+
+    Only recognises patterns of the form ``^X...`` where X is a letter or
+    digit that is not made optional and the pattern has no top-level
+    alternation. Returns None (could start with anything) otherwise.
+    """
+    if len(pattern) < 2 or pattern[0] != "^" or not pattern[1].isalnum():
+        return None
+    if len(pattern) > 2 and pattern[2] in "?*{":
+        return None
+    depth = 0
+    escaped = False
+    for char in pattern:
+        if escaped:
+            escaped = False
+        elif char == "\\":
+            escaped = True
+        elif char in "([":
+            depth += 1
+        elif char in ")]":
+            depth -= 1
+        elif char == "|" and depth == 0:
+            return None
+    return pattern[1].casefold()
+
+
+def compile_prefix_buckets() -> tuple[
+    dict[str, tuple[Pattern[str], dict[str, int | None]]],
+    tuple[Pattern[str], dict[str, int | None]],
+]:
+    """Group chromosome patterns by the first character a match must have.
+
+    Each bucket is a combined alternation (see compile_combined_pattern) of
+    the patterns anchored on that character plus the unanchored ones, in
+    their original order, so a lookup on ``name[:1].casefold()`` only tries
+    patterns that can possibly match.
+
+    Returns:
+        Tuple of (bucket per first character, fallback for other characters)
+    """
+    first_chars = [_required_first_char(p) for p, _name in CHROMOSOME_PATTERNS]
+    buckets = {
+        char: compile_combined_pattern(
+            [
+                entry
+                for entry, first in zip(CHROMOSOME_PATTERNS, first_chars)
+                if first is None or first == char
+            ]
+        )
+        for char in {c for c in first_chars if c is not None}
+    }
+    fallback = compile_combined_pattern(
+        [entry for entry, first in zip(CHROMOSOME_PATTERNS, first_chars) if first is None]
+    )
+    return buckets, fallback
+
+
 # Pre-compiled patterns for performance
 COMPILED_CHROMOSOME_PATTERNS = compile_patterns()
 COMPILED_UNLOCALIZED, COMPILED_FRAGMENT = compile_exclusion_patterns()
+COMPILED_UNLOCALIZED_RE, COMPILED_FRAGMENT_RE = compile_combined_exclusion_patterns()
+_CHROMOSOME_BUCKETS, _CHROMOSOME_FALLBACK = compile_prefix_buckets()
+
+
+@lru_cache(maxsize=1 << 16)
+def match_chromosome(name: str) -> tuple[str, str | None] | None:
+    """Match a scaffold name against all built-in chromosome patterns at once.
+
+    Only the patterns that can start with the name's first character are
+    tried, combined into a single alternation. Results are cached per name,
+    since batch runs see the same scaffold names across assemblies; use
+    match_chromosome.cache_clear() to reset.
+
+    Args:
+        name: Scaffold name from FASTA header
+
+    Returns:
+        Tuple of (method_name, chromosome_id) for the first matching pattern,
+        or None if no pattern matches
+    """
+    pattern, id_groups = _CHROMOSOME_BUCKETS.get(name[:1].casefold(), _CHROMOSOME_FALLBACK)
+    match = pattern.match(name)
+    if match is None:
+        return None
+    method = match.lastgroup
+    assert method is not None  # every alternative is a named group
+    id_group = id_groups[method]
+    return method, match.group(id_group) if id_group is not None else None
 
 
 def load_custom_patterns(
@@ -154,6 +327,30 @@ def load_custom_patterns(
     if not file_path.exists():
         raise FileNotFoundError(f"Patterns file not found: {file_path}")
 
+    # Re-reading an unchanged file is served from cache (keyed on mtime/size)
+    stat = file_path.stat()
+    chr_patterns, unloc_patterns, frag_patterns = _load_patterns_file(
+        file_path.resolve(), stat.st_mtime_ns, stat.st_size
+    )
+    return list(chr_patterns), list(unloc_patterns), list(frag_patterns)
+
+
+@lru_cache(maxsize=16)
+def _load_patterns_file(
+    file_path: Path,
+    mtime_ns: int,
+    size: int,
+) -> tuple[
+    tuple[tuple[str, str], ...],
+    tuple[str, ...],
+    tuple[str, ...],
+]:
+    """
+    Parse a patterns file into immutable pattern tuples.
+
+    The mtime and size arguments are only part of the cache key, so an
+    edited file is parsed again.
+    """
     # Read file content
     content = file_path.read_text()
 
@@ -206,15 +403,39 @@ def load_custom_patterns(
     unloc_patterns: list[str] = data.get("unlocalized_patterns", [])
     frag_patterns: list[str] = data.get("fragment_patterns", [])
 
-    return chr_patterns, unloc_patterns, frag_patterns
+    return tuple(chr_patterns), tuple(unloc_patterns), tuple(frag_patterns)
+
+
+# One line of the simple YAML subset: "key: value", "key:", "- item" or
+# "- key: value". Anything else (blank lines, comments) leaves key/dash unset.
+_YAML_LINE = re.compile(
+    r"^(?P<indent>[ \t]*)(?P<dash>-[ \t]*)?"
+    r"(?:(?P<key>[A-Za-z_][\w-]*)[ \t]*:(?:[ \t]+(?P<value>.*?))?|(?P<item>.*?))"
+    r"[ \t\r]*$",
+    re.MULTILINE,
+)
+
+
+def _yaml_scalar(text: str) -> str:
+    """Decode a scalar from the simple YAML subset (plain or quoted)."""
+    if len(text) >= 2 and text[0] == text[-1] == '"':
+        # YAML double-quoted escapes are a superset of JSON's common ones
+        try:
+            return str(json.loads(text))
+        except json.JSONDecodeError:
+            return text[1:-1]
+    if len(text) >= 2 and text[0] == text[-1] == "'":
+        return text[1:-1].replace("''", "'")
+    return text
 
 
 def _parse_simple_yaml(content: str) -> dict:
     """
     Very basic YAML parser for simple key-value and list structures.
 
-    This is a fallback when PyYAML is not installed.
-    Only handles simple cases like:
+    This is a fallback when PyYAML is not installed. JSON documents (which
+    are valid YAML) are handed to the json module; otherwise the text is
+    scanned with a single line regex. Only handles simple cases like:
         key:
           - item1
           - item2
@@ -222,64 +443,47 @@ def _parse_simple_yaml(content: str) -> dict:
           - pattern: "..."
             name: "..."
     """
-    lines = content.strip().split("\n")
-    result: dict = {}
-    current_key: str | None = None
-    current_list: list = []
-    current_dict: dict = {}
-
-    for line in lines:
-        stripped = line.strip()
-        if not stripped or stripped.startswith("#"):
-            continue
-
-        # Calculate indent
-        line_indent = len(line) - len(line.lstrip())
+    if content.lstrip().startswith("{"):
+        try:
+            data = json.loads(content)
+        except json.JSONDecodeError:
+            pass
+        else:
+            if isinstance(data, dict):
+                return data
 
-        # Top-level key
-        if line_indent == 0 and ":" in stripped:
-            # Save previous list if any
-            if current_key and current_list:
-                result[current_key] = current_list
-                current_list = []
-            if current_key and current_dict:
+    result: dict = {}
+    current_list: list | None = None
+    current_dict: dict | None = None
+
+    for match in _YAML_LINE.finditer(content):
+        key = match.group("key")
+        value = (match.group("value") or "").strip()
+
+        if match.group("dash") is not None:
+            # List item, either a scalar or the first key of a mapping
+            if current_list is None:
+                continue
+            if key is not None:
+                current_dict = {key: _yaml_scalar(value)}
                 current_list.append(current_dict)
-                result[current_key] = current_list
-                current_list = []
-                current_dict = {}
-
-            key = stripped.split(":")[0].strip()
-            value = ":".join(stripped.split(":")[1:]).strip()
-            current_key = key
+            else:
+                current_dict = None
+                current_list.append(_yaml_scalar(match.group("item").strip()))
+        elif key is None:
+            # Blank line or comment
+            continue
+        elif not match.group("indent"):
+            # Top-level key, either a scalar or the start of a list
+            current_dict = None
             if value:
-                result[key] = value
-
-        # List item
-        elif stripped.startswith("-"):
-            item_content = stripped[1:].strip()
-            # Check if it's a key-value in list item
-            if ":" in item_content and not item_content.startswith('"'):
-                if current_dict:
-                    current_list.append(current_dict)
-                current_dict = {}
-                key, value = item_content.split(":", 1)
-                current_dict[key.strip()] = value.strip().strip('"').strip("'")
+                result[key] = _yaml_scalar(value)
+                current_list = None
             else:
-                if current_dict:
-                    current_list.append(current_dict)
-                    current_dict = {}
-                current_list.append(item_content.strip('"').strip("'"))
-
-        # Continuation of dict item
-        elif ":" in stripped and current_dict is not None:
-            key, value = stripped.split(":", 1)
-            current_dict[key.strip()] = value.strip().strip('"').strip("'")
-
-    # Save final items
-    if current_dict:
-        current_list.append(current_dict)
-    if current_key and current_list:
-        result[current_key] = current_list
+                current_list = result[key] = []
+        elif current_dict is not None:
+            # Continuation of a mapping inside a list item
+            current_dict[key] = _yaml_scalar(value)
 
     return result
 
@@ -306,10 +510,10 @@ def merge_patterns(
     Returns:
         Tuple of compiled (chromosome_patterns, unlocalized_patterns, fragment_patterns)
     """
-    # Compile custom patterns
-    compiled_custom_chr = [(re.compile(p, re.IGNORECASE), n) for p, n in custom_chr]
-    compiled_custom_unloc = [re.compile(p, re.IGNORECASE) for p in custom_unloc]
-    compiled_custom_frag = [re.compile(p, re.IGNORECASE) for p in custom_frag]
+    # Compile custom patterns (cached, so repeated merges are cheap)
+    compiled_custom_chr = [(_compile_pattern(p), n) for p, n in custom_chr]
+    compiled_custom_unloc = [_compile_pattern(p) for p in custom_unloc]
+    compiled_custom_frag = [_compile_pattern(p) for p in custom_frag]
 
     if prepend:
         merged_chr = compiled_custom_chr + COMPILED_CHROMOSOME_PATTERNS
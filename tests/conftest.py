@@ -0,0 +1,45 @@
+"""Shared pytest configuration for the ChromDetect test suite."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the --run-slow option."""
+    parser.addoption(
+        "--run-slow",
+        action="store_true",
+        default=False,
+        help="Also run tests marked slow (e.g. those that spawn a subprocess)",
+    )
+
+
+def pytest_collection_modifyitems(
+    config: pytest.Config, items: list[pytest.Item]
+) -> None:
+    """Skip slow tests unless --run-slow is given."""
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test; use --run-slow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+# Contents of small_fasta; real bases rather than N so GC output stays populated
+SMALL_FASTA_BYTES = (
+    b">chr1\n" + b"ATCGATCG" * 100 + b"\n"
+    + b">chr2\n" + b"GCTAGCTA" * 100 + b"\n"
+    + b">scaffold1\n" + b"AAAAAAAA" * 50 + b"\n"
+)
+
+
+@pytest.fixture(scope="session")
+def small_fasta(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Create a small FASTA file for quick tests, once per session."""
+    path = tmp_path_factory.mktemp("fasta") / "small.fasta"
+    path.write_bytes(SMALL_FASTA_BYTES)
+    return path
@@ -3,6 +3,8 @@ Tests for NCBI assembly report parsing functionality.
 """
 
 
+import sys
+
 import pytest
 
 from chromdetect.assembly_report import (
@@ -55,6 +57,20 @@ class TestAssemblyReportEntry:
         assert entry.assigned_molecule == "1"
         assert entry.length == 248956422
 
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_entry_uses_slots(self):
+        """Test that entries do not carry a per-instance __dict__."""
+        entry = AssemblyReportEntry(
+            sequence_name="chr1",
+            sequence_role="assembled-molecule",
+            assigned_molecule="1",
+            assigned_molecule_type="Chromosome",
+            genbank_accession="CM000001.1",
+            refseq_accession="NC_000001.1",
+        )
+        assert not hasattr(entry, "__dict__")
+        assert entry.length is None
+
 
 class TestParseAssemblyReport:
     """Tests for parsing NCBI assembly reports."""
@@ -6,20 +6,22 @@ These functions provide a simpler API for common use cases.
 
 from __future__ import annotations
 
-import tempfile
 from pathlib import Path
 
 import pytest
 
 from chromdetect import (
+    AssemblyStats,
+    ComparisonResult,
+    ScaffoldInfo,
     classify_fasta,
     compare_fasta_files,
 )
 
 
-@pytest.fixture
-def simple_fasta() -> str:
-    """Create a simple test FASTA file."""
+@pytest.fixture(scope="session")
+def simple_fasta(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Create a simple test FASTA file, once per session."""
     content = """>chr1 test chromosome 1
 ACGTACGTACGTACGTACGTACGTACGTACGTACGTACGTACGTACGT
 ACGTACGTACGTACGTACGTACGTACGTACGTACGTACGTACGTACGT
@@ -28,14 +30,14 @@ GCTAGCTAGCTAGCTAGCTAGCTAGCTAGCTAGCTAGCTAGCTAGCTA
 >scaffold_1 unplaced
 NNNNNNNNNN
 """
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".fasta", delete=False) as f:
-        f.write(content)
-        return f.name
+    path = tmp_path_factory.mktemp("fasta") / "simple.fasta"
+    path.write_text(content)
+    return str(path)
 
 
-@pytest.fixture
-def second_fasta() -> str:
-    """Create a second test FASTA file for comparison."""
+@pytest.fixture(scope="session")
+def second_fasta(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Create a second test FASTA file for comparison, once per session."""
     content = """>chr1 test chromosome 1 - improved
 ACGTACGTACGTACGTACGTACGTACGTACGTACGTACGTACGTACGT
 ACGTACGTACGTACGTACGTACGTACGTACGTACGTACGTACGTACGT
@@ -45,25 +47,44 @@ GCTAGCTAGCTAGCTAGCTAGCTAGCTAGCTAGCTAGCTAGCTAGCTA
 >chr3 new chromosome
 ATATATATATATATATATATATATATATATATATATATATATATATATAT
 """
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".fasta", delete=False) as f:
-        f.write(content)
-        return f.name
+    path = tmp_path_factory.mktemp("fasta") / "second.fasta"
+    path.write_text(content)
+    return str(path)
+
+
+@pytest.fixture(scope="session")
+def classified_simple(simple_fasta: str) -> tuple[list[ScaffoldInfo], AssemblyStats]:
+    """Classify simple_fasta with default settings once per session.
+
+    Tests must treat the returned results as read-only.
+    """
+    return classify_fasta(simple_fasta)
+
+
+@pytest.fixture(scope="session")
+def comparison(simple_fasta: str, second_fasta: str) -> ComparisonResult:
+    """Compare simple_fasta against second_fasta once per session."""
+    return compare_fasta_files(simple_fasta, second_fasta)
 
 
 class TestClassifyFasta:
     """Tests for classify_fasta convenience function."""
 
-    def test_basic_classification(self, simple_fasta: str) -> None:
+    def test_basic_classification(
+        self, classified_simple: tuple[list[ScaffoldInfo], AssemblyStats]
+    ) -> None:
         """Test basic FASTA classification."""
-        results, stats = classify_fasta(simple_fasta)
+        results, stats = classified_simple
 
         assert stats.total_scaffolds == 3
         assert stats.chromosome_count == 2
         assert stats.unplaced_count == 1
 
-    def test_returns_scaffold_info(self, simple_fasta: str) -> None:
+    def test_returns_scaffold_info(
+        self, classified_simple: tuple[list[ScaffoldInfo], AssemblyStats]
+    ) -> None:
         """Test that results contain proper ScaffoldInfo objects."""
-        results, stats = classify_fasta(simple_fasta)
+        results, stats = classified_simple
 
         assert len(results) == 3
         chr1 = next(r for r in results if r.name == "chr1")
@@ -92,9 +113,11 @@ class TestClassifyFasta:
 
         assert stats.total_scaffolds == 3
 
-    def test_gc_content_calculated(self, simple_fasta: str) -> None:
+    def test_gc_content_calculated(
+        self, classified_simple: tuple[list[ScaffoldInfo], AssemblyStats]
+    ) -> None:
         """Test that GC content is calculated for scaffolds."""
-        results, stats = classify_fasta(simple_fasta)
+        results, stats = classified_simple
 
         # Check overall GC content
         assert stats.gc_content is not None
@@ -108,41 +131,41 @@ class TestClassifyFasta:
 class TestCompareFastaFiles:
     """Tests for compare_fasta_files convenience function."""
 
-    def test_basic_comparison(self, simple_fasta: str, second_fasta: str) -> None:
+    def test_basic_comparison(self, comparison: ComparisonResult) -> None:
         """Test basic FASTA file comparison."""
-        result = compare_fasta_files(simple_fasta, second_fasta)
+        result = comparison
 
         assert result.assembly1_name is not None
         assert result.assembly2_name is not None
         assert result.stats1.total_scaffolds == 3
         assert result.stats2.total_scaffolds == 3
 
-    def test_shared_chromosomes(self, simple_fasta: str, second_fasta: str) -> None:
+    def test_shared_chromosomes(self, comparison: ComparisonResult) -> None:
         """Test detection of shared chromosomes."""
-        result = compare_fasta_files(simple_fasta, second_fasta)
+        result = comparison
 
         # chr1 and chr2 are in both
         assert "chr1" in result.shared_chromosomes
         assert "chr2" in result.shared_chromosomes
 
-    def test_unique_chromosomes(self, simple_fasta: str, second_fasta: str) -> None:
+    def test_unique_chromosomes(self, comparison: ComparisonResult) -> None:
         """Test detection of unique chromosomes."""
-        result = compare_fasta_files(simple_fasta, second_fasta)
+        result = comparison
 
         # chr3 is only in second assembly
         assert "chr3" in result.unique_to_2
 
-    def test_size_differences(self, simple_fasta: str, second_fasta: str) -> None:
+    def test_size_differences(self, comparison: ComparisonResult) -> None:
         """Test detection of size differences."""
-        result = compare_fasta_files(simple_fasta, second_fasta)
+        result = comparison
 
         # chr1 is larger in second assembly
         if "chr1" in result.size_differences:
             assert result.size_differences["chr1"] > 0
 
-    def test_summary_method(self, simple_fasta: str, second_fasta: str) -> None:
+    def test_summary_method(self, comparison: ComparisonResult) -> None:
         """Test summary method returns expected keys."""
-        result = compare_fasta_files(simple_fasta, second_fasta)
+        result = comparison
         summary = result.summary()
 
         assert "total_shared_chromosomes" in summary
@@ -151,9 +174,9 @@ class TestCompareFastaFiles:
         assert "n50_difference" in summary
         assert "chromosome_count_difference" in summary
 
-    def test_to_dict_method(self, simple_fasta: str, second_fasta: str) -> None:
+    def test_to_dict_method(self, comparison: ComparisonResult) -> None:
         """Test to_dict serialization."""
-        result = compare_fasta_files(simple_fasta, second_fasta)
+        result = comparison
         d = result.to_dict()
 
         assert "assembly1_name" in d
@@ -162,11 +185,9 @@ class TestCompareFastaFiles:
         assert "stats2" in d
         assert "shared_chromosomes" in d
 
-    def test_extracts_assembly_names(
-        self, simple_fasta: str, second_fasta: str
-    ) -> None:
+    def test_extracts_assembly_names(self, comparison: ComparisonResult) -> None:
         """Test that assembly names are extracted from file paths."""
-        result = compare_fasta_files(simple_fasta, second_fasta)
+        result = comparison
 
         # Names should be derived from file stems
         assert result.assembly1_name != ""
@@ -180,15 +201,17 @@ class TestIntegration:
     """Integration tests for convenience functions."""
 
     def test_classify_then_compare_workflow(
-        self, simple_fasta: str, second_fasta: str
+        self,
+        classified_simple: tuple[list[ScaffoldInfo], AssemblyStats],
+        second_fasta: str,
+        comparison: ComparisonResult,
     ) -> None:
         """Test a typical workflow using both convenience functions."""
         # First classify both assemblies
-        results1, stats1 = classify_fasta(simple_fasta)
+        results1, stats1 = classified_simple
         results2, stats2 = classify_fasta(second_fasta)
 
-        # Then compare them using the file-based convenience function
-        comparison = compare_fasta_files(simple_fasta, second_fasta)
+        # comparison comes from the file-based convenience function
 
         # Results should be consistent
         assert comparison.stats1.chromosome_count == stats1.chromosome_count
@@ -1,6 +1,7 @@
 """Tests for core classification functionality."""
 
-import tempfile
+import sys
+from dataclasses import asdict
 from pathlib import Path
 
 import pytest
@@ -17,6 +18,11 @@ from chromdetect.core import (
 )
 
 
+def make_scaffolds(*specs: tuple[str, int]) -> list[tuple[str, int, str]]:
+    """Build parse_fasta-style (name, length, sample) tuples without a file."""
+    return [(name, length, "ACGT" * 100) for name, length in specs]
+
+
 class TestN50Calculations:
     """Test N50/N90 calculations."""
 
@@ -113,51 +119,37 @@ class TestSizeDetection:
 class TestFastaParsing:
     """Test FASTA file parsing."""
 
-    def test_parse_simple_fasta(self) -> None:
+    def test_parse_simple_fasta(self, tmp_path: Path) -> None:
         """Test parsing simple FASTA file."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".fasta", delete=False
-        ) as f:
-            f.write(">chr1\n")
-            f.write("ATGCATGCATGC\n")
-            f.write(">chr2\n")
-            f.write("GCTAGCTAGCTA\n")
-            f.flush()
-
-            scaffolds = parse_fasta(Path(f.name))
-
-            assert len(scaffolds) == 2
-            assert scaffolds[0][0] == "chr1"
-            assert scaffolds[0][1] == 12
-            assert scaffolds[1][0] == "chr2"
-            assert scaffolds[1][1] == 12
-
-    def test_parse_multiline_fasta(self) -> None:
+        path = tmp_path / "simple.fasta"
+        path.write_text(">chr1\nATGCATGCATGC\n>chr2\nGCTAGCTAGCTA\n")
+
+        scaffolds = parse_fasta(path)
+
+        assert len(scaffolds) == 2
+        assert scaffolds[0][0] == "chr1"
+        assert scaffolds[0][1] == 12
+        assert scaffolds[1][0] == "chr2"
+        assert scaffolds[1][1] == 12
+
+    def test_parse_multiline_fasta(self, tmp_path: Path) -> None:
         """Test parsing FASTA with multiline sequences."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".fasta", delete=False
-        ) as f:
-            f.write(">scaffold1 description text\n")
-            f.write("ATGC\n")
-            f.write("ATGC\n")
-            f.write("ATGC\n")
-            f.flush()
-
-            scaffolds = parse_fasta(Path(f.name))
-
-            assert len(scaffolds) == 1
-            assert scaffolds[0][0] == "scaffold1"  # Only first word
-            assert scaffolds[0][1] == 12
-
-    def test_parse_empty_file(self) -> None:
+        path = tmp_path / "multiline.fasta"
+        path.write_text(">scaffold1 description text\nATGC\nATGC\nATGC\n")
+
+        scaffolds = parse_fasta(path)
+
+        assert len(scaffolds) == 1
+        assert scaffolds[0][0] == "scaffold1"  # Only first word
+        assert scaffolds[0][1] == 12
+
+    def test_parse_empty_file(self, tmp_path: Path) -> None:
         """Test parsing empty FASTA file raises error."""
-        with tempfile.NamedTemporaryFile(
-            mode="w", suffix=".fasta", delete=False
-        ) as f:
-            f.flush()
+        path = tmp_path / "empty.fasta"
+        path.write_text("")
 
-            with pytest.raises(ValueError, match="(No scaffolds|Input is empty)"):
-                parse_fasta(Path(f.name))
+        with pytest.raises(ValueError, match="(No scaffolds|Input is empty)"):
+            parse_fasta(path)
 
     def test_parse_missing_file(self) -> None:
         """Test parsing missing file raises error."""
@@ -223,6 +215,17 @@ class TestClassifyScaffolds:
         chromosomes = [r for r in results if r.classification == "chromosome"]
         assert len(chromosomes) == 3
 
+    def test_classify_sample_scaffolds(self) -> None:
+        """Test classifying an assembly with two chromosome-sized scaffolds."""
+        scaffolds = make_scaffolds(
+            ("chr1", 50_000_000), ("chr2", 40_000_000), ("scaffold_ctg1", 100_000)
+        )
+        results, stats = classify_scaffolds(scaffolds)
+
+        assert stats.total_scaffolds == 3
+        assert stats.chromosome_count == 2
+        assert stats.unplaced_count == 1
+
     def test_empty_scaffolds_raises(self) -> None:
         """Test empty scaffold list raises error."""
         with pytest.raises(ValueError, match="No scaffolds"):
@@ -249,6 +252,33 @@ class TestScaffoldInfo:
         assert d["classification"] == "chromosome"
         assert d["chromosome_id"] == "1"
 
+    def test_to_dict_matches_asdict(self) -> None:
+        """Test the flat to_dict agrees with dataclasses.asdict, keys in order."""
+        info = ScaffoldInfo(
+            name="chr1",
+            length=1000,
+            classification="chromosome",
+            confidence=0.9,
+            detection_method="test",
+            chromosome_id="1",
+            gc_content=0.41,
+        )
+        assert list(info.to_dict().items()) == list(asdict(info).items())
+
+    @pytest.mark.skipif(sys.version_info < (3, 10), reason="dataclass slots need 3.10+")
+    def test_uses_slots(self) -> None:
+        """Test that instances do not carry a per-instance __dict__."""
+        info = ScaffoldInfo(
+            name="chr1",
+            length=1000,
+            classification="chromosome",
+            confidence=0.9,
+            detection_method="test",
+        )
+        assert not hasattr(info, "__dict__")
+        info.classification = "unplaced"  # Still mutable for karyotype adjustment
+        assert info.to_dict()["classification"] == "unplaced"
+
 
 class TestAssemblyStats:
     """Test AssemblyStats dataclass."""
@@ -3,10 +3,14 @@ Tests for custom pattern loading functionality.
 """
 
 
+import re
+
 import pytest
 
-from chromdetect.core import detect_by_name
+from chromdetect.core import classify_scaffolds, detect_by_name
 from chromdetect.patterns import (
+    _parse_simple_yaml,
+    combine_search_patterns,
     load_custom_patterns,
     merge_patterns,
 )
@@ -219,6 +223,88 @@ class TestDetectByNameWithCustomPatterns:
         assert classification == "unplaced"
 
 
+class TestCombineSearchPatterns:
+    """Tests for fusing custom unlocalized/fragment patterns."""
+
+    def test_fused_matches_any(self):
+        """Test the fused patterns match exactly when some input pattern does."""
+        _, merged_unloc, _ = merge_patterns([], ["special_unloc", "other_unloc"], [])
+        fused = combine_search_patterns(merged_unloc)
+
+        # One alternation for the custom patterns, one for the built-ins
+        assert len(fused) == 2
+        for name in ("scaffold_special_unloc_1", "chr1_random", "chrUn_5", "chr1", "ctg1"):
+            expected = any(p.search(name) for p in merged_unloc)
+            assert any(p.search(name) for p in fused) == expected
+
+    def test_grouped_patterns_not_fused(self):
+        """Test patterns with groups are left alone (backreferences would break)."""
+        patterns = [re.compile(r"(ab)\1"), re.compile("xyz")]
+        assert combine_search_patterns(patterns) is patterns
+
+    def test_singleton_flag_sets_not_fused(self):
+        """Test patterns are left alone when no two share the same flags."""
+        patterns = [re.compile("abc", re.IGNORECASE), re.compile("xyz")]
+        assert combine_search_patterns(patterns) is patterns
+
+    def test_fused_per_flag_set(self):
+        """Test patterns sharing flags are fused, one pattern per flag set."""
+        patterns = [
+            re.compile("abc", re.IGNORECASE),
+            re.compile("def", re.IGNORECASE),
+            re.compile("xyz"),
+        ]
+        fused = combine_search_patterns(patterns)
+
+        assert len(fused) == 2
+        assert [p.flags for p in fused] == [patterns[0].flags, patterns[2].flags]
+        for name in ("ABC", "xDEFx", "xyz", "XYZ"):
+            expected = any(p.search(name) for p in patterns)
+            assert any(p.search(name) for p in fused) == expected
+
+    def test_custom_patterns_keep_unicode_semantics(self):
+        """Test custom patterns are not compiled with re.ASCII like the built-ins."""
+        merged_chr, _, _ = merge_patterns([(r"^Chrom_(\w+)$", "unicode_chr")], [], [])
+        pattern, _ = merged_chr[0]
+
+        assert not pattern.flags & re.ASCII
+        assert pattern.match("Chrom_\u00e9").group(1) == "\u00e9"
+        # An inline (?u) flag clashes with re.ASCII but is fine here
+        merge_patterns([(r"(?u)^Chr_(\d+)$", "inline_unicode")], [], [])
+
+    def test_inline_flag_patterns_not_fused(self):
+        """Test patterns with a global inline flag are left alone."""
+        _, merged_unloc, _ = merge_patterns([], ["(?i)myrandom"], [])
+        assert combine_search_patterns(merged_unloc) is merged_unloc
+
+    def test_classify_with_inline_flag_pattern(self):
+        """Test classify_scaffolds accepts a custom pattern starting with (?i)."""
+        merged = merge_patterns([], ["(?i)myrandom"], [])
+        scaffolds = [
+            ("chr1", 50_000_000, ""),
+            ("scaffold_MyRandom_1", 20_000, ""),
+        ]
+        results, _ = classify_scaffolds(scaffolds, custom_patterns=merged)
+
+        assert [r.classification for r in results] == ["chromosome", "unlocalized"]
+
+    def test_classify_with_custom_exclusions(self):
+        """Test classify_scaffolds applies fused custom exclusion patterns."""
+        merged = merge_patterns([], ["special_unloc"], ["my_fragment"])
+        scaffolds = [
+            ("chr1", 50_000_000, ""),
+            ("scaffold_special_unloc_1", 20_000, ""),
+            ("scaffold_my_fragment_1", 20_000, ""),
+        ]
+        results, _ = classify_scaffolds(scaffolds, custom_patterns=merged)
+
+        assert [r.classification for r in results] == [
+            "chromosome",
+            "unlocalized",
+            "unplaced",
+        ]
+
+
 class TestPatternFileFormats:
     """Tests for different pattern file formats."""
 
@@ -242,3 +328,38 @@ class TestPatternFileFormats:
 
         chr_patterns, _, _ = load_custom_patterns(txt_file)
         assert len(chr_patterns) == 1
+
+
+class TestSimpleYamlParser:
+    """Tests for the fallback YAML parser used when PyYAML is missing."""
+
+    def test_parse_pattern_file(self):
+        """Test parsing the documented patterns file layout."""
+        content = """# custom patterns
+chromosome_patterns:
+  - pattern: "^MyScaffold_(\\\\d+)$"
+    name: "my_scaffold"
+  - pattern: '^Other_(\\d+)$'
+    name: other
+
+unlocalized_patterns:
+  - my_random
+  - "my:unloc"
+fragment_patterns:
+  - my_contig
+"""
+        result = _parse_simple_yaml(content)
+
+        assert result == {
+            "chromosome_patterns": [
+                {"pattern": "^MyScaffold_(\\d+)$", "name": "my_scaffold"},
+                {"pattern": "^Other_(\\d+)$", "name": "other"},
+            ],
+            "unlocalized_patterns": ["my_random", "my:unloc"],
+            "fragment_patterns": ["my_contig"],
+        }
+
+    def test_parse_json_document(self):
+        """Test that JSON content is accepted as YAML."""
+        content = '{"fragment_patterns": ["my_contig"]}'
+        assert _parse_simple_yaml(content) == {"fragment_patterns": ["my_contig"]}
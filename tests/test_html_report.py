@@ -3,6 +3,7 @@ Tests for HTML report generation functionality.
 """
 
 
+import io
 
 from chromdetect.core import AssemblyStats, ScaffoldInfo
 from chromdetect.html_report import (
@@ -10,6 +11,7 @@ from chromdetect.html_report import (
     _generate_bar_chart,
     _generate_pie_chart,
     generate_html_report,
+    write_html_report,
 )
 
 
@@ -234,3 +236,40 @@ class TestGenerateHTMLReport:
         # (sorted by size descending)
         assert "scaffold199" in html  # Largest should be included
         assert html.count("<tr>") <= 101  # Header + 100 rows
+
+    def test_report_reflects_changed_results(self):
+        """Test that the report reflects in-place changes to the results."""
+        results = [make_scaffold("chr1", 100_000_000, "chromosome")]
+        stats = make_stats()
+
+        first = generate_html_report(results, stats, "Test")
+        assert "class-chr" in first.split("<tbody>")[1]
+
+        results[0].classification = "unplaced"
+        second = generate_html_report(results, stats, "Test")
+
+        assert "class-unplaced" in second
+        assert "class-chr" not in second.split("<tbody>")[1]
+
+
+class TestWriteHTMLReport:
+    """Tests for streaming HTML report output."""
+
+    def test_write_matches_generate(self):
+        """Test that the streamed report has the same structure as the string one."""
+        results = [
+            make_scaffold("chr1", 200_000_000, "chromosome", chr_id="1"),
+            make_scaffold("scaffold1", 50_000, "unplaced"),
+        ]
+        stats = make_stats()
+
+        out = io.StringIO()
+        write_html_report(results, stats, out, "Test Assembly")
+        streamed = out.getvalue()
+        generated = generate_html_report(results, stats, "Test Assembly")
+
+        assert streamed.startswith("<!DOCTYPE html>")
+        assert streamed.endswith("</html>\n")
+        assert "${" not in streamed
+        assert streamed.split("Generated:")[0] == generated.split("Generated:")[0]
+        assert streamed.split("</header>")[1] == generated.split("</header>")[1]
@@ -1,11 +1,17 @@
 """Tests for chromosome naming pattern detection."""
 
+from __future__ import annotations
+
 import pytest
 
+from chromdetect import patterns
 from chromdetect.core import detect_by_name
 from chromdetect.patterns import (
     CHROMOSOME_PATTERNS,
     COMPILED_CHROMOSOME_PATTERNS,
+    _required_first_char,
+    compile_prefix_buckets,
+    match_chromosome,
 )
 
 
@@ -152,9 +158,85 @@ class TestPatternCompilation:
         """Test that all patterns compile successfully."""
         assert len(COMPILED_CHROMOSOME_PATTERNS) == len(CHROMOSOME_PATTERNS)
 
+    def test_patterns_are_ascii_only(self) -> None:
+        """Test that non-ASCII digits are not treated as chromosome IDs."""
+        classification, _, _, _ = detect_by_name("chr\u0661")  # Arabic-Indic one
+        assert classification == "other"
+
     def test_compiled_patterns_match(self) -> None:
         """Test compiled patterns produce same results."""
         test_names = ["chr1", "Super_scaffold_1", "LG_X"]
         for name in test_names:
             classification, _, _, _ = detect_by_name(name)
             assert classification == "chromosome"
+
+    @pytest.mark.parametrize(
+        "name",
+        [
+            "chr1",
+            "Chr_X",
+            "SUPER_2",
+            "LG-W",
+            "NC_000001.11",
+            "CM000001.1",
+            "7",
+            "HiC_scaffold_5",
+            "Scaffold_3_RaGOO",
+            "Gm04",
+            "scaffold_3_cov20",
+            "unknown_sequence",
+        ],
+    )
+    def test_combined_pattern_matches_individual(self, name: str) -> None:
+        """Test combined alternation agrees with the individual patterns."""
+        expected = None
+        for pattern, method in COMPILED_CHROMOSOME_PATTERNS:
+            match = pattern.match(name)
+            if match:
+                expected = (method, match.group(1) if match.lastindex else None)
+                break
+        assert match_chromosome(name) == expected
+
+    def test_match_chromosome_is_cached(self) -> None:
+        """Test repeated names are served from the match cache."""
+        match_chromosome.cache_clear()
+        first = match_chromosome("chr12")
+        second = match_chromosome("chr12")
+
+        assert first == second == ("chr_explicit", "12")
+        assert match_chromosome.cache_info().hits == 1
+
+
+class TestPrefixBuckets:
+    """Test grouping chromosome patterns by required first character."""
+
+    @pytest.mark.parametrize(
+        "pattern,expected",
+        [
+            (r"^chr(\d+)$", "c"),
+            (r"^Super_(\d+)$", "s"),  # Case-folded, as bucket keys are
+            (r"^[Cc]hr(\d+)$", None),  # Character class
+            (r"^(?:chr|LG)(\d+)$", None),  # Group at the start
+            (r"^chr\d+$|^LG\d+$", None),  # Top-level alternation
+            (r"^c?hr\d+$", None),  # Optional first character
+            (r"chr\d+", None),  # Unanchored
+        ],
+    )
+    def test_required_first_char(self, pattern: str, expected: str | None) -> None:
+        """Test only anchored literal prefixes yield a first character."""
+        assert _required_first_char(pattern) == expected
+
+    def test_unanchored_pattern_in_every_bucket(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test unanchored patterns are tried in every bucket and the fallback."""
+        monkeypatch.setattr(
+            patterns,
+            "CHROMOSOME_PATTERNS",
+            [(r"^chr(\d+)$", "chr"), (r"^LG(\d+)$", "lg"), (r"_chrom(\d+)$", "anywhere")],
+        )
+        buckets, (fallback, fallback_groups) = compile_prefix_buckets()
+
+        assert set(buckets) == {"c", "l"}
+        assert list(buckets["c"][1]) == ["chr", "anywhere"]
+        assert list(buckets["l"][1]) == ["lg", "anywhere"]
+        assert list(fallback_groups) == ["anywhere"]
+        assert fallback.match("_chrom7").group(fallback_groups["anywhere"]) == "7"